@@ -1,6 +1,6 @@
 """
 Project 3: Python Data Project
-Fetch from the web -> Process with Python collections -> Write CSV, Excel, JSON, Text
+Fetch from the web -> Process with Python collections and pandas -> Write CSV, Excel, JSON, Text
 Logging via utils_logger.py
 
 Run:
@@ -10,16 +10,20 @@ Run:
 from __future__ import annotations
 
 import csv
-import json
+import io
 import os
 import re
-from collections import Counter, defaultdict
+import shutil
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from statistics import mean
 from typing import List, Dict, Any
 
+import orjson
+import pandas as pd
 import requests
 from openpyxl import Workbook
+from requests.adapters import HTTPAdapter
 
 # Logging helper (copy this file from the example repo into your project root)
 from utils_logger import get_logger  # type: ignore
@@ -47,61 +51,109 @@ XLSX_OUT = os.path.join(PROC_DIR, "summary.xlsx")
 JSON_OUT = os.path.join(PROC_DIR, "posts_summary.json")
 TEXT_OUT = os.path.join(PROC_DIR, "text_report.txt")
 
+# Word tokenizer pattern, compiled once
+_WORD_RE = re.compile(r"[A-Za-z']+")
+
+# One shared HTTP session so connections (and adapters) are reused across fetches
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10))
+SESSION.headers.update({"Accept-Encoding": "gzip", "Connection": "keep-alive"})
+
 
 # -----------------------
 # Helpers
 # -----------------------
-def fetch_to_bytes(url: str, timeout: int = 30) -> bytes:
-    LOGGER.info(f"Fetching: {url}")
-    r = requests.get(url, timeout=timeout)
-    r.raise_for_status()
-    return r.content
-
-
-def save_raw(content: bytes, filename: str) -> str:
+def fetch_to_file(url: str, filename: str, timeout: int = 30) -> str:
+    """Stream the response body straight into RAW_DIR without buffering it in memory."""
     path = os.path.join(RAW_DIR, filename)
-    with open(path, "wb") as f:
-        f.write(content)
+    part_path = path + ".part"
+    LOGGER.info(f"Fetching: {url}")
+    # write to a .part file and swap it in only once the whole body has arrived,
+    # so a failed download never truncates the previous good raw file
+    try:
+        with SESSION.get(url, stream=True, timeout=timeout) as r:
+            r.raise_for_status()
+            r.raw.decode_content = True  # let urllib3 un-gzip the body
+            # 1 MB buffer/chunks: fewer read()/write() calls on larger downloads
+            with open(part_path, "wb", buffering=1 << 20) as f:
+                shutil.copyfileobj(r.raw, f, 1 << 20)
+        os.replace(part_path, path)
+    except BaseException:
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        raise
     LOGGER.info(f"Saved raw: {path}")
     return path
 
 
-def read_csv_bytes(content: bytes) -> List[Dict[str, str]]:
-    txt = content.decode("utf-8", errors="replace").splitlines()
-    reader = csv.DictReader(txt)
-    return list(reader)
+def read_raw(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def read_csv_bytes(content: bytes) -> pd.DataFrame:
+    # index_col=False: a trailing delimiter must not turn Month into the index and shift
+    #   every year column left by one
+    # usecols=header width: extra fields on a row are dropped and its year cells still
+    #   count (csv.DictReader filed them under None) instead of failing the whole parse
+    # na_filter=False: empty cells stay "" so one gap doesn't turn an int column into floats
+    header = content.split(b"\n", 1)[0].decode("utf-8", errors="replace")
+    width = len(next(csv.reader([header])))
+    opts = dict(
+        index_col=False,
+        usecols=range(width),
+        na_filter=False,
+        encoding_errors="replace",
+    )
+    df = pd.read_csv(io.BytesIO(content), **opts)
+    # float columns have lost their source text; re-read just those as text so
+    # process_airtravel can apply the integer-only rule to them
+    float_cols = [c for c, dt in df.dtypes.items() if dt.kind == "f"]
+    if float_cols:
+        df = pd.read_csv(io.BytesIO(content), dtype={c: str for c in float_cols}, **opts)
+    return df
 
 
 def tokenize(text: str) -> List[str]:
-    # words only, lowercase
-    return re.findall(r"[a-zA-Z']+", text.lower())
+    # words only, lowercase (lowercase the matches, not a full copy of the text)
+    return [w.lower() for w in _WORD_RE.findall(text)]
 
 
 # -----------------------
 # Processing functions
 # -----------------------
-def process_airtravel(rows: List[Dict[str, str]]) -> Dict[str, Dict[str, int | float]]:
+def process_airtravel(df: pd.DataFrame) -> Dict[str, Dict[str, int | float]]:
     """
-    Input: rows like [{'Month':'JAN','1958':'340','1959':'360','1960':'417'}, ...]
+    Input: frame with a Month column plus one column per year, e.g.
+           Month | 1958 | 1959 | 1960
+           JAN   | 340  | 360  | 417
     Output: per-year totals and averages.
     """
-    years = [y for y in rows[0].keys() if y.lower() != "month"]
-    per_year_values: Dict[str, List[int]] = defaultdict(list)
-
-    for row in rows:
-        for y in years:
-            val = row.get(y, "").strip()
-            if val.isdigit():
-                per_year_values[y].append(int(val))
-
     summary: Dict[str, Dict[str, int | float]] = {}
-    for y, vals in per_year_values.items():
+    # walk (label, column) pairs directly so year labels are never looked up again;
+    # only whole-integer cells count (same rule as int()), anything else is skipped
+    for y, col in df.items():
+        if y.lower() == "month":
+            continue
+        if col.dtype.kind in "iu":
+            # the C parser already typed every cell as an integer: sum the column directly
+            n = len(col)
+            total = int(col.sum())
+        else:
+            cells = col.astype(str).str.strip()
+            cells = cells[cells.str.fullmatch(r"[+-]?\d+")]
+            n = len(cells)
+            total = int(cells.astype("int64").sum()) if n else 0
+        if not n:
+            continue
         summary[y] = {
-            "months_counted": len(vals),
-            "total_passengers": sum(vals),
-            "avg_per_month": round(mean(vals), 2) if vals else 0.0,
+            "months_counted": n,
+            "total_passengers": total,
+            # exact means stay ints (e.g. 381, not 381.0), as statistics.mean gave
+            "avg_per_month": total // n if total % n == 0 else round(total / n, 2),
         }
-    LOGGER.info(f"Airtravel summary: {summary}")
+    # lazy + DEBUG: the summary is only repr'd if a sink actually accepts DEBUG
+    LOGGER.opt(lazy=True).debug("Airtravel summary: {}", lambda: summary)
     return summary
 
 
@@ -109,12 +161,15 @@ def process_posts(posts: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Count posts per userId and top words across all titles + bodies.
     """
-    per_user = Counter([p.get("userId") for p in posts])
-    all_text = " ".join([(p.get("title", "") + " " + p.get("body", "")) for p in posts])
-    words = tokenize(all_text)
-    # filter short words
-    words = [w for w in words if len(w) > 3]
-    top_words = Counter(words).most_common(15)
+    # single pass: count users and words post by post (no big joined string)
+    per_user: Counter = Counter()
+    word_counter: Counter = Counter()
+    for p in posts:
+        per_user[p.get("userId")] += 1
+        words = tokenize(p.get("title", "") + " " + p.get("body", ""))
+        # filter short words
+        word_counter.update(w for w in words if len(w) > 3)
+    top_words = word_counter.most_common(15)
 
     summary = {
         "post_count": len(posts),
@@ -132,7 +187,7 @@ def process_text_report(text: str) -> Dict[str, Any]:
     chars = len(text)
     words = tokenize(text)
     word_count = len(words)
-    top_words = Counter([w for w in words if len(w) > 4]).most_common(20)
+    top_words = Counter(w for w in words if len(w) > 4).most_common(20)
 
     return {
         "characters": chars,
@@ -145,27 +200,31 @@ def process_text_report(text: str) -> Dict[str, Any]:
 # Writers
 # -----------------------
 def write_csv_yearly_totals(summary: Dict[str, Dict[str, int | float]], path: str) -> None:
-    fieldnames = ["year", "months_counted", "total_passengers", "avg_per_month"]
     with open(path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for year, stats in summary.items():
-            writer.writerow({"year": year, **stats})
+        writer = csv.writer(f)
+        writer.writerow(["year", "months_counted", "total_passengers", "avg_per_month"])
+        writer.writerows(
+            (year, stats["months_counted"], stats["total_passengers"], stats["avg_per_month"])
+            for year, stats in summary.items()
+        )
     LOGGER.info(f"Wrote CSV: {path}")
 
 
 def write_excel(summary: Dict[str, Dict[str, int | float]], path: str) -> None:
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "AirTravel Summary"
+    # write_only streams rows out instead of keeping a cell graph in memory
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("AirTravel Summary")
+    items_by_year = sorted(summary.items())
+    items_by_total = sorted(items_by_year, key=lambda kv: kv[1]["total_passengers"], reverse=True)
+
     ws.append(["Year", "Months Counted", "Total Passengers", "Avg Per Month"])
-    for year, stats in sorted(summary.items()):
+    for year, stats in items_by_year:
         ws.append([year, stats["months_counted"], stats["total_passengers"], stats["avg_per_month"]])
 
     # A second sheet with a simple “ranking” by total passengers
     ws2 = wb.create_sheet("Totals Ranking")
     ws2.append(["Year", "Total Passengers"])
-    for year, stats in sorted(summary.items(), key=lambda kv: kv[1]["total_passengers"], reverse=True):
+    for year, stats in items_by_total:
         ws2.append([year, stats["total_passengers"]])
 
     wb.save(path)
@@ -173,25 +232,24 @@ def write_excel(summary: Dict[str, Dict[str, int | float]], path: str) -> None:
 
 
 def write_json(data: Dict[str, Any], path: str) -> None:
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    # userId keys are ints, hence OPT_NON_STR_KEYS
+    with open(path, "wb") as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
     LOGGER.info(f"Wrote JSON: {path}")
 
 
 def write_text_report(metrics: Dict[str, Any], path: str, source_name: str) -> None:
-    lines = [
-        f"Text Report for: {source_name}",
-        f"Generated: {datetime.now().isoformat(timespec='seconds')}",
-        "-" * 60,
-        f"Characters: {metrics['characters']}",
-        f"Word Count: {metrics['word_count']}",
-        "",
-        "Top Words (min length 5):",
-    ]
+    buf = io.StringIO()
+    buf.write(f"Text Report for: {source_name}\n")
+    buf.write(f"Generated: {datetime.now().isoformat(timespec='seconds')}\n")
+    buf.write("-" * 60 + "\n")
+    buf.write(f"Characters: {metrics['characters']}\n")
+    buf.write(f"Word Count: {metrics['word_count']}\n")
+    buf.write("\nTop Words (min length 5):\n")
     for w, c in metrics["top_words"]:
-        lines.append(f"  {w:<20} {c}")
+        buf.write(f"  {w:<20} {c}\n")
     with open(path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+        f.write(buf.getvalue())
     LOGGER.info(f"Wrote Text: {path}")
 
 
@@ -201,30 +259,42 @@ def write_text_report(metrics: Dict[str, Any], path: str, source_name: str) -> N
 def main() -> None:
     LOGGER.info("=== Project 3 start ===")
 
-    # 1) Fetch and persist RAW files
-    csv_bytes = fetch_to_bytes(CSV_URL)
-    json_bytes = fetch_to_bytes(JSON_URL)
-    text_bytes = fetch_to_bytes(TEXT_URL)
-
-    save_raw(csv_bytes, "airtravel.csv")
-    save_raw(json_bytes, "posts.json")
-    save_raw(text_bytes, "requests_readme.txt")
+    # 1) Fetch and persist RAW files (downloads are I/O-bound, so run them in parallel)
+    sources = [
+        ("csv", CSV_URL, "airtravel.csv"),
+        ("json", JSON_URL, "posts.json"),
+        ("text", TEXT_URL, "requests_readme.txt"),
+    ]
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        futures = {name: ex.submit(fetch_to_file, url, filename) for name, url, filename in sources}
+    csv_bytes = read_raw(futures["csv"].result())
+    json_bytes = read_raw(futures["json"].result())
+    text_bytes = read_raw(futures["text"].result())
 
     # 2) Process
-    rows = read_csv_bytes(csv_bytes)
-    air_summary = process_airtravel(rows)
-
-    posts_data = json.loads(json_bytes.decode("utf-8", errors="replace"))
+    air_df = read_csv_bytes(csv_bytes)
+    air_summary = process_airtravel(air_df)
+
+    try:
+        posts_data = orjson.loads(json_bytes)
+    except orjson.JSONDecodeError:
+        # orjson requires strict UTF-8; fall back to replacing bad bytes like the CSV path
+        posts_data = orjson.loads(json_bytes.decode("utf-8", errors="replace"))
     posts_summary = process_posts(posts_data)
 
     text_str = text_bytes.decode("utf-8", errors="replace")
     text_metrics = process_text_report(text_str)
 
-    # 3) Write processed outputs
-    write_csv_yearly_totals(air_summary, CSV_OUT)
-    write_excel(air_summary, XLSX_OUT)
-    write_json(posts_summary, JSON_OUT)
-    write_text_report(text_metrics, TEXT_OUT, source_name="psf/requests README")
+    # 3) Write processed outputs (independent files, so write them in parallel)
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        writes = [
+            ex.submit(write_csv_yearly_totals, air_summary, CSV_OUT),
+            ex.submit(write_excel, air_summary, XLSX_OUT),
+            ex.submit(write_json, posts_summary, JSON_OUT),
+            ex.submit(write_text_report, text_metrics, TEXT_OUT, source_name="psf/requests README"),
+        ]
+    for fut in writes:
+        fut.result()  # re-raise any writer error
 
     LOGGER.info("=== Project 3 complete ===")
     print("Done. See: data/raw, data/processed, and logs/project3.log")
@@ -0,0 +1,57 @@
+"""
+Tests for the airtravel CSV path in project3.py.
+Run from the repo root:
+    python -m pytest -q
+"""
+
+import importlib
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def project3(tmp_path, monkeypatch):
+    # project3 creates data/ and logs/ folders on import, so import it inside tmp_path
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(ROOT)
+    sys.modules.pop("project3", None)
+    return importlib.import_module("project3")
+
+
+def summarize(project3, content: bytes):
+    return project3.process_airtravel(project3.read_csv_bytes(content))
+
+
+def test_sample_airtravel_file(project3):
+    with open(os.path.join(ROOT, "data", "raw", "airtravel.csv"), "rb") as f:
+        summary = summarize(project3, f.read())
+
+    assert summary[' "1958"'] == {"months_counted": 12, "total_passengers": 4572, "avg_per_month": 381}
+    assert summary[' "1959"'] == {"months_counted": 12, "total_passengers": 5140, "avg_per_month": 428.33}
+    assert summary[' "1960"'] == {"months_counted": 12, "total_passengers": 5714, "avg_per_month": 476.17}
+
+
+def test_trailing_delimiter_does_not_shift_columns(project3):
+    summary = summarize(project3, b"Month,1958,1959,1960\nJAN,340,360,417,\nFEB,318,342,391,\n")
+
+    assert summary["1958"]["total_passengers"] == 658
+    assert summary["1959"]["total_passengers"] == 702
+    assert summary["1960"]["total_passengers"] == 808
+
+
+def test_row_with_extra_field_is_truncated(project3):
+    summary = summarize(project3, b"Month,1958,1959\nJAN,340,360\nFEB,318,342,999\nMAR,1,2\n")
+
+    assert summary["1958"] == {"months_counted": 3, "total_passengers": 659, "avg_per_month": 219.67}
+    assert summary["1959"] == {"months_counted": 3, "total_passengers": 704, "avg_per_month": 234.67}
+
+
+def test_only_integer_cells_count(project3):
+    summary = summarize(project3, b"Month,1958,1959\nJAN,340,10.7\nFEB,,10.6\nMAR,x,1e3\nAPR, 12 ,-5\n")
+
+    assert summary["1958"] == {"months_counted": 2, "total_passengers": 352, "avg_per_month": 176}
+    assert summary["1959"] == {"months_counted": 1, "total_passengers": -5, "avg_per_month": -5}
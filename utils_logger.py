@@ -34,8 +34,7 @@ def get_logger(name: str = "app", log_file: str = "logs/app.log"):
         level="INFO",
         encoding="utf-8",
         rotation="1 MB",
-        retention=5,
-        enqueue=True
+        retention=5
     )
 
     _logger.info(f"Logger initialized. Writing to {log_file}")